@@ -5,30 +5,68 @@ Comprehensive AC3 detection for Puppeteer's .sgb audio containers
 Finds ALL AC3 streams including damaged/offset headers
 """
 
+import bisect
+import io
+import logging
+import mmap
 import os
 import struct
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 
+# AC3 frame sizes in 16-bit words, indexed [fscod][frmsizecod]
+# (ATSC A/52 table 5.18; fscod 0 = 48 kHz, 1 = 44.1 kHz, 2 = 32 kHz)
+AC3_FRAME_WORDS = (
+    (64, 64, 80, 80, 96, 96, 112, 112, 128, 128, 160, 160, 192, 192,
+     224, 224, 256, 256, 320, 320, 384, 384, 448, 448, 512, 512,
+     640, 640, 768, 768, 896, 896, 1024, 1024, 1152, 1152, 1280, 1280),
+    (69, 70, 87, 88, 104, 105, 121, 122, 139, 140, 174, 175, 208, 209,
+     243, 244, 278, 279, 348, 349, 417, 418, 487, 488, 557, 558,
+     696, 697, 835, 836, 975, 976, 1114, 1115, 1253, 1254, 1393, 1394),
+    (96, 96, 120, 120, 144, 144, 168, 168, 192, 192, 240, 240, 288, 288,
+     336, 336, 384, 384, 480, 480, 576, 576, 672, 672, 768, 768,
+     960, 960, 1152, 1152, 1344, 1344, 1536, 1536, 1728, 1728, 1920, 1920),
+)
+
+log = logging.getLogger('stringpuller')
+
 class StringPuller:
-    def __init__(self):
+    def __init__(self, quiet=False):
+        # Quiet keeps warnings but drops the per-file and per-stream progress
+        log.setLevel(logging.WARNING if quiet else logging.INFO)
+        self.quiet = quiet
         self.folder_path = None
         self.output_folder = None
         self.total_streams_found = 0
         self.total_files_processed = 0
+        self.zero_heavy_blocks = []  # Per-file 4KB blocks with >450 zero bytes
     
     def comprehensive_ac3_detection(self, data, filename):
         """Ultra-comprehensive AC3 detection for Puppeteer"""
         streams = []
         data_len = len(data)
         
-        print(f"      🎭 PUPPETEER AC3 scan: {data_len:,} bytes...")
+        log.info(f"      🎭 PUPPETEER AC3 scan: {data_len:,} bytes...")
+        
+        # Scan the raw buffer up front; the strategies below post-process
+        # these offsets instead of each walking the whole file again
+        sync_positions = self.find_ac3_sync_positions(data)
+        structure_points = self.find_structure_points(data)
+        
+        # A 1000-byte window spans at most two 4KB blocks, so it can only be
+        # 90% zeros if one of them holds more than 450 zero bytes
+        zero_block_counts = self.count_zero_blocks(data)
+        self.zero_heavy_blocks = [block for block, zeros in enumerate(zero_block_counts) if zeros > 450]
         
         # Strategy 1: Perfect AC3 sync detection
-        perfect_ac3_streams = self.find_perfect_ac3_streams(data)
+        perfect_ac3_streams = self.find_perfect_ac3_streams(data, sync_positions)
         streams.extend(perfect_ac3_streams)
         
         # Strategy 2: Offset AC3 detection (headers with padding)
-        offset_ac3_streams = self.find_offset_ac3_streams(data)
+        offset_ac3_streams = self.find_offset_ac3_streams(data, sync_positions)
         streams.extend(offset_ac3_streams)
         
         # Strategy 3: AC3 frame pattern detection
@@ -36,7 +74,7 @@ class StringPuller:
         streams.extend(frame_ac3_streams)
         
         # Strategy 4: Puppeteer container structure analysis
-        container_ac3_streams = self.analyze_puppeteer_structure(data, filename)
+        container_ac3_streams = self.analyze_puppeteer_structure(data, structure_points, filename)
         streams.extend(container_ac3_streams)
         
         # Strategy 5: Missing AC3 recovery (fill gaps)
@@ -45,23 +83,44 @@ class StringPuller:
         
         return streams
     
-    def find_perfect_ac3_streams(self, data):
-        """Find AC3 streams with perfect 0B 77 headers"""
-        streams = []
+    def find_ac3_sync_positions(self, data):
+        """Find the offset of every 0B 77 sync word in one pass"""
+        positions = []
         ac3_signature = b'\x0B\x77'
         
-        print("         🎯 Perfect AC3 sync detection...")
-        
         pos = 0
-        found_count = 0
-        
         while True:
-            pos = data.find(ac3_signature, pos)
+            # memoryview has no find(); search the backing mmap in place
+            pos = data.obj.find(ac3_signature, pos)
             if pos == -1:
                 break
+            positions.append(pos)
+            pos += 2  # Sync words cannot overlap
+        
+        return positions
+    
+    def count_zero_blocks(self, data):
+        """Count the zero bytes in each 4KB block of the file"""
+        return [data[pos:pos + 4096].tobytes().count(0) for pos in range(0, len(data), 4096)]
+    
+    def find_perfect_ac3_streams(self, data, sync_positions):
+        """Find AC3 streams with perfect 0B 77 headers"""
+        streams = []
+        
+        log.info("         🎯 Perfect AC3 sync detection...")
+        
+        next_pos = 0
+        found_count = 0
+        min_frames = 3  # Consecutive frames needed before sizing a stream
+        
+        for pos in sync_positions:
+            if pos < next_pos:  # Inside a stream we already took
+                continue
             
-            # Validate AC3 header
-            if self.validate_ac3_header(data, pos):
+            # Validate AC3 header, then hop frame to frame so stray sync
+            # words never reach the expensive stream size scan
+            if (self.validate_ac3_header(data, pos)
+                    and self.count_ac3_frames(data, pos, min_frames) >= min_frames):
                 stream_size = self.calculate_ac3_stream_size(data, pos)
                 
                 streams.append({
@@ -72,54 +131,58 @@ class StringPuller:
                 })
                 
                 found_count += 1
-                pos += stream_size if stream_size > 1000 else 1000
-            else:
-                pos += 1
+                next_pos = pos + (stream_size if stream_size > 1000 else 1000)
         
         if found_count > 0:
-            print(f"         ✅ Found {found_count} perfect AC3 streams")
+            log.info(f"         ✅ Found {found_count} perfect AC3 streams")
         
         return streams
     
-    def find_offset_ac3_streams(self, data):
+    def find_offset_ac3_streams(self, data, sync_positions):
         """Find AC3 streams that might be offset by padding"""
         streams = []
         
-        print("         🔍 Offset AC3 detection...")
+        log.info("         🔍 Offset AC3 detection...")
         
-        # Look for AC3 patterns with up to 16 bytes of preceding padding
+        # Look for AC3 patterns with up to 16 bytes of preceding padding.
+        # Padded headers are probed in 16-byte windows 1-16 bytes into each
+        # 4KB block, i.e. syncs starting 1-30 bytes into the block.
         found_count = 0
+        scan_limit = len(data) - 16
+        found_starts = []  # Sorted starts of streams found so far
         
-        for offset in range(1, 17):  # Check 1-16 byte offsets
-            search_pos = offset
+        for actual_pos in sync_positions:
+            offset = actual_pos % 4096
+            if offset < 1 or offset > 30:
+                continue
             
-            while search_pos < len(data) - 16:
-                # Look for potential AC3 after padding
-                chunk = data[search_pos:search_pos + 16]
-                
-                for i in range(len(chunk) - 1):
-                    if chunk[i] == 0x0B and chunk[i + 1] == 0x77:
-                        actual_pos = search_pos + i
-                        
-                        if self.validate_ac3_header(data, actual_pos):
-                            # Check if we haven't already found this stream
-                            if not any(abs(s['start'] - actual_pos) < 100 for s in streams):
-                                stream_size = self.calculate_ac3_stream_size(data, actual_pos)
-                                
-                                streams.append({
-                                    'method': 'offset_ac3',
-                                    'start': actual_pos,
-                                    'size': stream_size,
-                                    'confidence': 'medium',
-                                    'offset': offset + i
-                                })
-                                
-                                found_count += 1
+            # First probe window that covers this sync must start in range
+            if actual_pos - offset + max(1, offset - 14) >= scan_limit:
+                continue
+            
+            if self.validate_ac3_header(data, actual_pos):
+                # Check if we haven't already found this stream; only the
+                # nearest found start on either side can be within 100 bytes
+                idx = bisect.bisect_left(found_starts, actual_pos)
+                near_before = idx > 0 and actual_pos - found_starts[idx - 1] < 100
+                near_after = idx < len(found_starts) and found_starts[idx] - actual_pos < 100
                 
-                search_pos += 4096  # Jump in 4KB increments for speed
+                if not (near_before or near_after):
+                    bisect.insort(found_starts, actual_pos)
+                    stream_size = self.calculate_ac3_stream_size(data, actual_pos)
+                    
+                    streams.append({
+                        'method': 'offset_ac3',
+                        'start': actual_pos,
+                        'size': stream_size,
+                        'confidence': 'medium',
+                        'offset': offset
+                    })
+                    
+                    found_count += 1
         
         if found_count > 0:
-            print(f"         ✅ Found {found_count} offset AC3 streams")
+            log.info(f"         ✅ Found {found_count} offset AC3 streams")
         
         return streams
     
@@ -127,21 +190,24 @@ class StringPuller:
         """Find AC3 by analyzing frame patterns"""
         streams = []
         
-        print("         📊 AC3 frame pattern analysis...")
+        log.info("         📊 AC3 frame pattern analysis...")
         
         # AC3 frames have specific bit patterns
         # Look for repeated frame structures
         frame_candidates = []
         
-        # Scan for potential AC3 frame starts
-        for i in range(0, len(data) - 8, 2048):  # Every 2KB
-            chunk = data[i:i + 8]
-            
+        # Scan for potential AC3 frame starts every 2KB. Strided slices
+        # copy out byte k of every probe in one go; zipping them gives the
+        # first 8 bytes of each probe without slicing the file per probe.
+        scan_limit = len(data) - 8
+        probes = range(0, scan_limit, 2048)
+        heads = zip(*[data[k:scan_limit + k:2048].tobytes() for k in range(8)])
+        
+        for i, head in zip(probes, heads):
             # AC3 frames often start with specific patterns
-            if len(chunk) >= 4:
-                # Check for AC3-like patterns (not just 0B 77)
-                if self.looks_like_ac3_frame(chunk):
-                    frame_candidates.append(i)
+            # Check for AC3-like patterns (not just 0B 77)
+            if self.looks_like_ac3_frame(head):
+                frame_candidates.append(i)
         
         # Group nearby candidates into streams
         if frame_candidates:
@@ -181,16 +247,12 @@ class StringPuller:
                 })
         
         if streams:
-            print(f"         ✅ Found {len(streams)} frame pattern streams")
+            log.info(f"         ✅ Found {len(streams)} frame pattern streams")
         
         return streams
     
-    def analyze_puppeteer_structure(self, data, filename):
-        """Analyze Puppeteer-specific container structure"""
-        streams = []
-        
-        print("         🎭 Puppeteer container analysis...")
-        
+    def find_structure_points(self, data):
+        """Find the offsets of Puppeteer container markers, sorted"""
         # Look for Puppeteer-specific patterns
         puppeteer_markers = [
             b'RIFF', b'WAVE', b'DATA', b'SDAT',
@@ -203,7 +265,7 @@ class StringPuller:
         for marker in puppeteer_markers:
             pos = 0
             while True:
-                pos = data.find(marker, pos)
+                pos = data.obj.find(marker, pos)
                 if pos == -1:
                     break
                 structure_points.append(pos)
@@ -212,6 +274,14 @@ class StringPuller:
         # Sort structure points
         structure_points.sort()
         
+        return structure_points
+    
+    def analyze_puppeteer_structure(self, data, structure_points, filename):
+        """Analyze Puppeteer-specific container structure"""
+        streams = []
+        
+        log.info("         🎭 Puppeteer container analysis...")
+        
         # Extract regions between structure points
         for i in range(len(structure_points) - 1):
             start = structure_points[i]
@@ -221,8 +291,7 @@ class StringPuller:
             # Only consider reasonable-sized chunks
             if 5000 < size < 50 * 1024 * 1024:  # 5KB to 50MB
                 # Check if this chunk contains AC3-like data
-                chunk_sample = data[start:start + min(1024, size)]
-                if self.chunk_looks_like_ac3(chunk_sample):
+                if self.chunk_looks_like_ac3(data, start, min(1024, size)):
                     streams.append({
                         'method': 'puppeteer_structure',
                         'start': start,
@@ -231,7 +300,7 @@ class StringPuller:
                     })
         
         if streams:
-            print(f"         ✅ Found {len(streams)} structure-based streams")
+            log.info(f"         ✅ Found {len(streams)} structure-based streams")
         
         return streams
     
@@ -239,7 +308,7 @@ class StringPuller:
         """Fill gaps to recover missing AC3 streams"""
         streams = []
         
-        print("         🔧 Recovering missing AC3 streams...")
+        log.info("         🔧 Recovering missing AC3 streams...")
         
         # Sort existing streams by start position
         existing_streams.sort(key=lambda x: x['start'])
@@ -253,9 +322,7 @@ class StringPuller:
             # If there's a significant gap, extract it as potential AC3
             if gap_size > 50000:  # 50KB gap
                 # Sample the gap to see if it looks like audio
-                gap_sample = data[current_end:current_end + min(4096, gap_size)]
-                
-                if self.chunk_looks_like_ac3(gap_sample):
+                if self.chunk_looks_like_ac3(data, current_end, min(4096, gap_size)):
                     streams.append({
                         'method': 'gap_recovery',
                         'start': current_end,
@@ -287,107 +354,177 @@ class StringPuller:
                 })
         
         if streams:
-            print(f"         ✅ Recovered {len(streams)} missing streams")
+            log.info(f"         ✅ Recovered {len(streams)} missing streams")
         
         return streams
     
     def validate_ac3_header(self, data, pos):
         """Validate AC3 header at position"""
-        if pos + 5 > len(data):
+        # Need the sync word plus bytes 2-5; bounds are checked once up
+        # front so the hot path needs no exception handling
+        if pos + 6 > len(data):
             return False
         
         # Check AC3 sync word
         if data[pos] != 0x0B or data[pos + 1] != 0x77:
             return False
         
-        # Basic AC3 header validation
-        try:
-            # Check frame size (bytes 2-3)
-            frame_size = ((data[pos + 2] & 0x3F) << 8) | data[pos + 3]
-            if frame_size == 0 or frame_size > 3840:  # Max AC3 frame size
-                return False
-            
-            # Check sample rate and bit rate codes
-            sr_code = (data[pos + 4] & 0xC0) >> 6
-            bsid = (data[pos + 5] & 0xF8) >> 3
+        # Check frame size code (byte 4); bytes 2-3 are CRC1, not a size
+        if not self.ac3_frame_size(data, pos):
+            return False
+        
+        # Check bitstream ID
+        bsid = data[pos + 5] >> 3
+        return bsid <= 16
+    
+    def ac3_frame_size(self, data, pos):
+        """Frame size in bytes from the AC3 header at pos, 0 if invalid"""
+        if pos + 5 > len(data):
+            return 0
+        
+        # Byte 4: fscod (bits 6-7) and frmsizecod (bits 0-5)
+        fscod = data[pos + 4] >> 6
+        frmsizecod = data[pos + 4] & 0x3F
+        if fscod > 2 or frmsizecod > 37:  # Reserved codes
+            return 0
+        
+        return AC3_FRAME_WORDS[fscod][frmsizecod] * 2
+    
+    def count_ac3_frames(self, data, pos, limit):
+        """Count back-to-back AC3 frames from pos, stopping at limit"""
+        frames = 0
+        
+        while frames < limit:
+            if pos + 2 > len(data) or data[pos] != 0x0B or data[pos + 1] != 0x77:
+                break
             
-            if sr_code > 3 or bsid > 16:
-                return False
+            frame_size = self.ac3_frame_size(data, pos)
+            if not frame_size:
+                break
             
-            return True
-        except:
-            return False
+            frames += 1
+            pos += frame_size  # Next sync word sits right after this frame
+        
+        return frames
     
     def calculate_ac3_stream_size(self, data, start_pos):
         """Calculate AC3 stream size"""
         max_size = min(len(data) - start_pos, 50 * 1024 * 1024)  # Max 50MB
+        new_stream_gap = 10 * 1024 * 1024  # 10MB = probably new stream
         
-        # Try to find the end of the AC3 stream
+        # Try to find the end of the AC3 stream, probing every 4KB
         # Look for next AC3 sync or end of meaningful data
-        current_pos = start_pos + 1000  # Skip first frame
-        
-        while current_pos < start_pos + max_size - 2:
-            # Look for next AC3 sync
-            if data[current_pos] == 0x0B and data[current_pos + 1] == 0x77:
-                # Check if this is a new stream (large gap) or continuation
-                gap = current_pos - start_pos
-                if gap > 10 * 1024 * 1024:  # 10MB = probably new stream
-                    return gap
+        first_probe = start_pos + 1000  # Skip first frame
+        end_pos = start_pos + max_size - 2
+        
+        # Look for long runs of zeros (end of stream)
+        zero_probe = self.find_zero_run_probe(data, first_probe, end_pos)
+        
+        # Look for next AC3 sync before that; closer syncs than the gap are
+        # just continuation frames, so start at the first probe past it
+        skipped_probes = -(-(new_stream_gap + 1 - 1000) // 4096)
+        sync_probe = self.find_sync_probe(data, first_probe + skipped_probes * 4096,
+                                          end_pos if zero_probe is None else zero_probe)
+        
+        if sync_probe is not None:
+            return sync_probe - start_pos
+        if zero_probe is not None:
+            return zero_probe - start_pos
+        
+        # Default: reasonable chunk size
+        return min(max_size, 20 * 1024 * 1024)  # 20MB default
+    
+    def find_zero_run_probe(self, data, first_probe, end_pos):
+        """Find the first 4KB-step probe whose 1000 bytes are 90% zeros"""
+        data_len = len(data)
+        heavy_blocks = self.zero_heavy_blocks
+        
+        # Only probes whose window touches a zero-heavy block can qualify
+        idx = bisect.bisect_left(heavy_blocks, first_probe >> 12)
+        
+        while idx < len(heavy_blocks):
+            block_start = heavy_blocks[idx] << 12
+            steps = max(0, -((first_probe - block_start + 999) // 4096))
+            probe = first_probe + steps * 4096
             
-            # Look for long runs of zeros (end of stream)
-            if current_pos + 1000 < len(data):
-                chunk = data[current_pos:current_pos + 1000]
+            while probe < block_start + 4096:
+                if probe >= end_pos or probe + 1000 >= data_len:
+                    return None
+                
+                chunk = data[probe:probe + 1000].tobytes()
                 if chunk.count(0) > 900:  # 90% zeros
-                    return current_pos - start_pos
+                    return probe
+                
+                probe += 4096
             
-            current_pos += 4096  # Jump in 4KB increments
+            idx += 1
         
-        # Default: reasonable chunk size
-        return min(max_size, 20 * 1024 * 1024)  # 20MB default
+        return None
     
-    def looks_like_ac3_frame(self, chunk):
-        """Check if chunk looks like start of AC3 frame"""
-        if len(chunk) < 4:
+    def find_sync_probe(self, data, first_probe, end_pos):
+        """Find the first 4KB-step probe that lands on an AC3 sync word"""
+        if first_probe >= end_pos:
+            return None
+        
+        # Strided slices copy out bytes 0 and 1 of every probe at once
+        first_bytes = data[first_probe:end_pos:4096].tobytes()
+        second_bytes = data[first_probe + 1:end_pos + 1:4096].tobytes()
+        
+        step = first_bytes.find(b'\x0B')
+        while step != -1:
+            if second_bytes[step] == 0x77:
+                return first_probe + step * 4096
+            step = first_bytes.find(b'\x0B', step + 1)
+        
+        return None
+    
+    def looks_like_ac3_frame(self, head):
+        """Check if leading bytes look like start of AC3 frame"""
+        if len(head) < 4:
             return False
         
         # Check for various AC3-like patterns
-        patterns = [
-            b'\x0B\x77',  # Standard AC3
-            b'\x77\x0B',  # Byte-swapped AC3
-        ]
-        
-        for pattern in patterns:
-            if chunk.startswith(pattern):
-                return True
+        first, second = head[0], head[1]
+        if first == 0x0B and second == 0x77:  # Standard AC3
+            return True
+        if first == 0x77 and second == 0x0B:  # Byte-swapped AC3
+            return True
         
         # Check for high entropy (audio-like randomness)
-        if len(chunk) >= 8:
-            unique_bytes = len(set(chunk[:8]))
+        if len(head) >= 8:
+            unique_bytes = len(set(head[:8]))
             if unique_bytes >= 6:  # Good variety of bytes
                 return True
         
         return False
     
-    def chunk_looks_like_ac3(self, chunk):
-        """Check if a chunk contains AC3-like audio data"""
-        if len(chunk) < 100:
+    def chunk_looks_like_ac3(self, data, start, size):
+        """Check if the chunk at start contains AC3-like audio data"""
+        if min(size, len(data) - start) < 100:
             return False
         
-        # Check for AC3 patterns within chunk
-        if b'\x0B\x77' in chunk:
+        # Check for AC3 patterns within chunk, searching the backing mmap
+        # in place so nothing is copied when a sync word is there
+        if data.obj.find(b'\x0B\x77', start, start + size) != -1:
             return True
         
-        # Check entropy
-        byte_counts = [0] * 256
-        for byte in chunk:
-            byte_counts[byte] += 1
+        # Copy out just the sample; it is at most a few KB
+        chunk = data[start:start + size].tobytes()
         
-        # Calculate entropy
-        entropy = 0
-        for count in byte_counts:
-            if count > 0:
-                prob = count / len(chunk)
-                entropy -= prob * (prob * 8)  # Simplified entropy
+        # Runs of a constant byte (mostly zero padding) are never audio;
+        # reject them from the first 32 bytes before building a histogram
+        head = chunk[:32]
+        if head.count(head[0:1]) > 24:
+            return False
+        
+        # Check entropy (Counter tallies the bytes in C)
+        byte_counts = Counter(chunk)
+        
+        # Simplified entropy: -8 * sum(p^2), an index-of-coincidence score.
+        # Summing integer squares needs one division instead of one per byte.
+        chunk_len = len(chunk)
+        sum_squares = sum(count * count for count in byte_counts.values())
+        entropy = -8 * sum_squares / (chunk_len * chunk_len)
         
         # High entropy suggests audio/compressed data
         return entropy > 6
@@ -403,13 +540,27 @@ class StringPuller:
         
         unique_streams = []
         
+        # Kept streams ordered by start, so each candidate is only compared
+        # with kept streams that can actually reach it
+        kept_starts = []
+        kept_by_start = []
+        longest_kept = 0
+        
         for stream in streams:
+            start = stream['start']
+            end = start + stream['size']
+            
+            # An overlapping kept stream starts before this one ends, and no
+            # further back than the longest kept stream could reach
+            first = bisect.bisect_right(kept_starts, start - longest_kept)
+            last = bisect.bisect_left(kept_starts, end)
+            
             # Check for overlap with higher-confidence streams
             overlaps = False
             
-            for existing in unique_streams:
-                overlap_start = max(stream['start'], existing['start'])
-                overlap_end = min(stream['start'] + stream['size'], existing['start'] + existing['size'])
+            for existing in kept_by_start[first:last]:
+                overlap_start = max(start, existing['start'])
+                overlap_end = min(end, existing['start'] + existing['size'])
                 overlap_size = max(0, overlap_end - overlap_start)
                 
                 # If >30% overlap, consider it duplicate
@@ -420,36 +571,56 @@ class StringPuller:
             
             if not overlaps:
                 unique_streams.append(stream)
+                
+                idx = bisect.bisect_right(kept_starts, start)
+                kept_starts.insert(idx, start)
+                kept_by_start.insert(idx, stream)
+                longest_kept = max(longest_kept, stream['size'])
         
         return unique_streams
     
     def extract_puppeteer_ac3_file(self, file_path):
         """Extract all AC3 streams from a Puppeteer .sgb file"""
         filename = Path(file_path).name
-        print(f"🎭 EXTRACTING: {filename}")
-        print("=" * 60)
+        log.info(f"🎭 EXTRACTING: {filename}")
+        log.info("=" * 60)
         
-        # Load file
+        # Map file instead of reading it; slices of the view are zero-copy
         with open(file_path, 'rb') as f:
-            data = f.read()
-        
-        file_size = len(data)
-        print(f"📏 File size: {file_size:,} bytes ({file_size / 1024 / 1024:.1f} MB)")
-        
+            file_size = os.fstat(f.fileno()).st_size
+            log.info(f"📏 File size: {file_size:,} bytes ({file_size / 1024 / 1024:.1f} MB)")
+            
+            if file_size == 0:  # mmap cannot map an empty file
+                log.info("      ❌ No AC3 streams found")
+                return 0
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Detection scans front to back; let the kernel read ahead
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):  # Python 3.8+, not Windows
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                
+                data = memoryview(mm)
+                try:
+                    return self.extract_ac3_streams(data, f.fileno(), filename)
+                finally:
+                    data.release()
+    
+    def extract_ac3_streams(self, data, source_fd, filename):
+        """Detect and write out the AC3 streams in a mapped .sgb file"""
         # Comprehensive AC3 detection
         all_streams = self.comprehensive_ac3_detection(data, filename)
         
         if not all_streams:
-            print("      ❌ No AC3 streams found")
+            log.info("      ❌ No AC3 streams found")
             return 0
         
         # Remove overlaps
         unique_streams = self.remove_overlapping_streams(all_streams)
         
-        print(f"\n      💾 EXTRACTION SUMMARY")
-        print(f"      Found {len(all_streams)} total streams")
-        print(f"      Extracting {len(unique_streams)} unique streams")
-        print()
+        log.info(f"\n      💾 EXTRACTION SUMMARY")
+        log.info(f"      Found {len(all_streams)} total streams")
+        log.info(f"      Extracting {len(unique_streams)} unique streams")
+        log.info("")
         
         # Extract streams
         extracted_count = 0
@@ -459,7 +630,6 @@ class StringPuller:
                 # Extract data
                 start = stream['start']
                 size = stream['size']
-                stream_data = data[start:start + size]
                 
                 # Generate clean filename
                 base_name = Path(filename).stem
@@ -482,19 +652,41 @@ class StringPuller:
                 output_file = self.output_folder / output_filename
                 
                 # Write file
-                with open(output_file, 'wb') as f:
-                    f.write(stream_data)
+                written = self.write_stream(data, source_fd, start, size, output_file)
                 
-                size_mb = len(stream_data) / 1024 / 1024
-                print(f"         ✅ {output_filename} ({size_mb:.1f} MB)")
+                size_mb = written / 1024 / 1024
+                log.info(f"         ✅ {output_filename} ({size_mb:.1f} MB)")
                 extracted_count += 1
                 
             except Exception as e:
-                print(f"         ❌ Failed to extract stream {i}: {e}")
+                log.warning(f"         ❌ Failed to extract stream {i}: {e}")
         
-        print(f"\n      🎉 Extracted {extracted_count} AC3 files!")
+        log.info(f"\n      🎉 Extracted {extracted_count} AC3 files!")
         return extracted_count
     
+    def write_stream(self, data, source_fd, start, size, output_file):
+        """Write one stream to disk, returning the number of bytes written"""
+        with open(output_file, 'wb') as f:
+            # Copy file to file inside the kernel where supported (Linux)
+            if hasattr(os, 'sendfile'):
+                try:
+                    offset = start
+                    end = start + size
+                    while offset < end:
+                        sent = os.sendfile(f.fileno(), source_fd, offset, end - offset)
+                        if sent == 0:  # End of the source file
+                            break
+                        offset += sent
+                    return offset - start
+                except OSError:
+                    # e.g. macOS only sends to sockets; rewrite from the map
+                    f.seek(0)
+                    f.truncate()
+            
+            stream_data = data[start:start + size]
+            f.write(stream_data)
+            return len(stream_data)
+    
     def check_ffmpeg_available(self):
         """Check if ffmpeg is available"""
         try:
@@ -513,6 +705,7 @@ class StringPuller:
                 'ffmpeg', '-i', str(ac3_file), 
                 '-acodec', 'pcm_s16le',  # 16-bit PCM
                 '-ar', '44100',          # 44.1kHz sample rate
+                '-threads', '1',         # Files are converted side by side
                 '-y',                    # Overwrite output
                 str(wav_file)
             ]
@@ -520,7 +713,7 @@ class StringPuller:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
             return result.returncode == 0
         except Exception as e:
-            print(f"         ❌ Conversion failed: {e}")
+            log.warning(f"         ❌ Conversion failed: {e}")
             return False
     
     def offer_wav_conversion(self):
@@ -587,26 +780,34 @@ class StringPuller:
         successful_conversions = 0
         failed_conversions = 0
         
-        for i, ac3_file in enumerate(ac3_files, 1):
-            # Generate WAV filename
-            wav_filename = ac3_file.stem + ".wav"
-            wav_file = wav_folder / wav_filename
-            
-            print(f"🔄 [{i}/{len(ac3_files)}] Converting: {ac3_file.name}")
+        # Run one ffmpeg per CPU; each is its own process, so threads are
+        # enough to keep them busy. Results are reported as they finish.
+        max_workers = min(len(ac3_files), os.cpu_count() or 1)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for ac3_file in ac3_files:
+                # Generate WAV filename
+                wav_file = wav_folder / (ac3_file.stem + ".wav")
+                future = executor.submit(self.convert_ac3_to_wav, ac3_file, wav_file)
+                futures[future] = (ac3_file, wav_file)
             
-            # Convert
-            if self.convert_ac3_to_wav(ac3_file, wav_file):
-                # Check if WAV file was created and has reasonable size
-                if wav_file.exists() and wav_file.stat().st_size > 1000:
-                    wav_size = wav_file.stat().st_size / 1024 / 1024
-                    print(f"         ✅ Created: {wav_filename} ({wav_size:.1f} MB)")
-                    successful_conversions += 1
+            for i, future in enumerate(as_completed(futures), 1):
+                ac3_file, wav_file = futures[future]
+                log.info(f"🔄 [{i}/{len(ac3_files)}] Converted: {ac3_file.name}")
+                
+                if future.result():
+                    # Check if WAV file was created and has reasonable size
+                    if wav_file.exists() and wav_file.stat().st_size > 1000:
+                        wav_size = wav_file.stat().st_size / 1024 / 1024
+                        log.info(f"         ✅ Created: {wav_file.name} ({wav_size:.1f} MB)")
+                        successful_conversions += 1
+                    else:
+                        log.warning(f"         ❌ Conversion failed: Invalid output")
+                        failed_conversions += 1
                 else:
-                    print(f"         ❌ Conversion failed: Invalid output")
+                    log.warning(f"         ❌ Conversion failed")
                     failed_conversions += 1
-            else:
-                print(f"         ❌ Conversion failed")
-                failed_conversions += 1
         
         # Summary
         print(f"\n🎉 CONVERSION COMPLETE!")
@@ -619,6 +820,13 @@ class StringPuller:
         print("   • AC3: Smaller, perfect for media players")
         print("   • WAV: Larger, perfect for audio editing")
 
+    def find_sgb_files(self, folder_path):
+        """List .sgb files in a folder"""
+        # scandir entries carry cached type info, so large disc dumps stay cheap
+        with os.scandir(folder_path) as entries:
+            return [Path(entry.path) for entry in entries
+                    if entry.is_file() and entry.name.lower().endswith('.sgb')]
+    
     def get_folder_path(self):
         """Get the .sgb folder path from user"""
         print("STRINGPULLER - Puppeteer Audio Extractor")
@@ -655,8 +863,7 @@ class StringPuller:
                 continue
             
             # Check for .sgb files
-            import glob
-            sgb_files = glob.glob(os.path.join(folder_path, "*.sgb"))
+            sgb_files = self.find_sgb_files(folder_path)
             
             if not sgb_files:
                 print(f"No .sgb files found in: {folder_path}")
@@ -689,7 +896,7 @@ class StringPuller:
         
         # Get all .sgb files
         folder = Path(self.folder_path)
-        sgb_files = [f for f in folder.iterdir() if f.suffix.lower() == '.sgb']
+        sgb_files = self.find_sgb_files(folder)
         
         if not sgb_files:
             print("No .sgb files found!")
@@ -704,14 +911,21 @@ class StringPuller:
         print(f"Output folder: {self.output_folder}")
         print()
         
-        # Process each file
-        for i, file_path in enumerate(sgb_files, 1):
-            streams_extracted = self.extract_puppeteer_ac3_file(file_path)
-            self.total_streams_found += streams_extracted
-            self.total_files_processed += 1
+        # Process files in parallel, one worker process per CPU; reports
+        # come back in file order so output never interleaves
+        worker = partial(extract_file_worker, self.output_folder, self.quiet)
+        max_workers = min(len(sgb_files), os.cpu_count() or 1)
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(worker, sgb_files)
             
-            if i < len(sgb_files):
-                print("\n" + "="*80 + "\n")
+            for i, (streams_extracted, report) in enumerate(results, 1):
+                print(report, end="")
+                self.total_streams_found += streams_extracted
+                self.total_files_processed += 1
+                
+                if i < len(sgb_files):
+                    log.info("\n" + "="*80 + "\n")
         
         # Final summary
         print("STRINGPULLER EXTRACTION COMPLETE!")
@@ -729,7 +943,26 @@ class StringPuller:
         print("Your Puppeteer audio collection is ready!")
         print("Play files with VLC, Audacity, or any media player")
 
+def extract_file_worker(output_folder, quiet, file_path):
+    """Extract one .sgb file in a worker process, returning its report"""
+    extractor = StringPuller(quiet=quiet)
+    extractor.output_folder = output_folder
+    
+    # Buffer the file's log in memory so the parent can print it in one piece
+    report = io.StringIO()
+    handler = logging.StreamHandler(report)
+    log.addHandler(handler)
+    log.propagate = False
+    try:
+        streams_extracted = extractor.extract_puppeteer_ac3_file(file_path)
+    finally:
+        log.removeHandler(handler)
+        log.propagate = True
+    
+    return streams_extracted, report.getvalue()
+
 def main():
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
     extractor = StringPuller()
     
     try: